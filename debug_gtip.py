@@ -7,6 +7,16 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from pypdf import PdfReader  # Updated from PyPDF2
 
+# Compiled once instead of on every tested page
+AMOUNT_PATTERNS = [
+    re.compile(
+        r"(?:Sum|Total\s*(?:Price|Quote)?)\s*[:\-]?\s+([\d\.\,\s]{4,}?)\s*(€|EUR|\$)",
+        re.IGNORECASE
+    ),
+    re.compile(r"([\d\.\,]{4,})\s*€", re.IGNORECASE),
+]
+EURO_AMOUNT_LINE_PATTERN = re.compile(r"\d.*€")
+
 def test_gtip_pdf():
     pdf_path = r"E:\DELTA\GTip\Soya Yağı\Teklif\Proposal_Delta_EN.pdf"
 
@@ -45,16 +55,8 @@ def test_gtip_pdf():
 
                     # Test Sum pattern
                     print("🔍 Testing Sum extraction:")
-                    amount_patterns = [
-                        re.compile(
-                            r"(?:Sum|Total\s*(?:Price|Quote)?)\s*[:\-]?\s+([\d\.\,\s]{4,}?)\s*(€|EUR|\$)",
-                            re.IGNORECASE
-                        ),
-                        re.compile(r"([\d\.\,]{4,})\s*€", re.IGNORECASE),
-                    ]
-
                     found = False
-                    for i, pattern in enumerate(amount_patterns):
+                    for i, pattern in enumerate(AMOUNT_PATTERNS):
                         match = pattern.search(text)
                         if match:
                             print(f"✓ Pattern {i+1} matched:")
@@ -68,7 +70,7 @@ def test_gtip_pdf():
                         print("✗ No amount pattern matched")
                         print("\nLines with 'Sum' or numbers followed by €:")
                         for line in text.splitlines():
-                            if "sum" in line.lower() or re.search(r"\d.*€", line):
+                            if "sum" in line.lower() or EURO_AMOUNT_LINE_PATTERN.search(line):
                                 print(f"  {line.strip()}")
 
             except Exception as e:
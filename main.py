@@ -1,111 +1,103 @@
+import json
 import logging
+import multiprocessing
 import os
 import re
 import sqlite3
-import tkinter as tk
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Iterable
+from functools import partial
+from io import BytesIO, TextIOWrapper
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 import streamlit as st
-from pypdf import PdfReader  # Updated from PyPDF2 to pypdf for better encoding support
-from tkinter import filedialog
+
+from teklif_parser import (
+    PAGE_TEXT_BACKEND,
+    OfferRecord,
+    normalize_currency,
+    normalize_firm_name,
+    parse_offer_safe,
+    sanitize_text,
+)
 
 DB_PATH = "teklifler.db"
 LOG_PATH = "teklif_listeleme.log"
+# read_log_tail reads the log backwards in blocks of this many bytes
+LOG_TAIL_BLOCK_SIZE = 8192
 OFFER_FOLDER_PATTERN = re.compile(r"teklif", re.IGNORECASE)
-
-FIRM_PATTERNS = [
-    # Turkish patterns
-    re.compile(r"(?:Firma\s*Adı|Firma|Şirket|Müşteri|Kurum|Kuruluş)\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    # English patterns
-    re.compile(r"(?:Company\s*Name|Company|Client|Customer|Organization)\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    # Company type abbreviations (works for both Turkish and English)
-    re.compile(r"(.+?(?:A\.Ş\.|A\.S\.|Ltd\.?\s*Şti\.?|San\.|Tic\.|Ltd\.|Inc\.|Corp\.|GmbH))", re.IGNORECASE),
-]
-
-GREETINGS_PATTERN = re.compile(r"(?:Sayın|Dear)\s+(.+)", re.IGNORECASE)
-
-SUBJECT_PATTERNS = [
-    # Turkish patterns
-    re.compile(r"Konu\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    re.compile(r"Teklif\s*Konusu\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    re.compile(r"İlgi\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    # English patterns
-    re.compile(r"Subject\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    re.compile(r"Regarding\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    re.compile(r"Project\s*[:\-]?\s*(.+)", re.IGNORECASE),
-    # Both languages
-    re.compile(r"(?:Re|RE|Ref)\s*[:\-]?\s*(.+)", re.IGNORECASE),
-]
-
-AMOUNT_PATTERNS = [
-    # PRIORITY 1: Sum pattern (most specific - final total in proposals)
-    # Must come first to avoid matching subtotals like "Total Quote"
-    # Example: "Sum                    2.125.400€"
-    re.compile(
-        r"\bSum\s*[:\-]?\s+([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)",
-        re.IGNORECASE,
-    ),
-
-    # PRIORITY 2: Turkish patterns - Total amount with keywords
-    # Example: "Toplam Tutar: 1.677 289,00 Euro" or "Teklif Tutarı: 157.500 €"
-    re.compile(
-        r"(?:Toplam\s*(?:Tutar|Fiyat)?|Teklif\s*Tutarı|Genel\s*Toplam)\s*[:\-]?\s*(?:\([^\)]*\))?\s*([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro)",
-        re.IGNORECASE,
-    ),
-
-    # PRIORITY 3: English patterns - Grand Total (avoid "Total Quote" which is subtotal)
-    # Example: "Grand Total: 1,925.000€" or "Total Price: 1.925.000€"
-    re.compile(
-        r"(?:Grand\s*Total|Total\s*(?:Price|Amount|Cost))\s*[:\-]?\s*(?:\([^\)]*\))?\s+([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)",
-        re.IGNORECASE,
-    ),
-
-    # FALLBACK: Match large amounts with currency (minimum 4 characters)
-    # This catches amounts without keywords - use only as last resort
-    re.compile(r"([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)", re.IGNORECASE),
-]
-
-OFFER_KEYWORD_PATTERN = re.compile(r"\b(?:teklif|offer|quote|proposal)\b", re.IGNORECASE)
-
-# Firm name abbreviations for standardization
-_ABBREVIATIONS = {
-    "a.ş": "A.Ş",
-    "a.ş.": "A.Ş.",
-    "ltd": "Ltd.",
-    "ltd.": "Ltd.",
-    "şti": "Şti.",
-    "şti.": "Şti.",
-    "inc": "Inc.",
-    "inc.": "Inc.",
-    "gmbh": "GmbH",
+# Every ASCII case spelling of ".pdf", so str.endswith checks names without lowercasing them
+_PDF_SUFFIXES = tuple(f".{p}{d}{f}" for p in "pP" for d in "dD" for f in "fF")
+# Minimum delay between progress/status updates sent to the UI while scanning
+PROGRESS_INTERVAL_SECONDS = 0.12
+# Threads walking offer folders at once; directory listing is I/O-bound (slow on network shares)
+FOLDER_SCAN_WORKERS = 8
+# Each spawned parser process re-imports streamlit and pandas, so keep the pool small
+MAX_PARSE_WORKERS = 4
+# Cached page lists stop where parse_offer stopped reading; bump when the parser
+# changes so rows written for an older one are ignored
+PAGE_CACHE_VERSION = 1
+# Stay well below SQLite's bound-parameter limit in IN (...) lookups
+SQL_PARAM_CHUNK_SIZE = 500
+
+LOG_CONFIG = {
+    "filename": LOG_PATH,
+    "level": logging.INFO,
+    "format": "%(asctime)s %(levelname)s %(message)s",
+    "encoding": "utf-8",  # Fix Turkish character encoding in logs
 }
-# Pre-compile regex patterns for performance
-_COMPILED_ABBR_PATTERNS = [
-    (re.compile(re.escape(k), re.IGNORECASE), v) for k, v in _ABBREVIATIONS.items()
-]
-
-logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
-    encoding="utf-8",  # Fix Turkish character encoding in logs
-)
+logging.basicConfig(**LOG_CONFIG)
 
 
-@dataclass
-class OfferRecord:
-    file_path: str
-    firm: str
-    subject: str
-    amount: float | None
-    currency: str | None
+@st.cache_resource
+def get_connection() -> sqlite3.Connection:
+    """Return the app-wide SQLite connection.
+
+    Streamlit re-executes the script on every rerun, so the connection is kept in
+    st.cache_resource instead of a module global. Script runs happen on different
+    threads, hence check_same_thread=False; use it through db_transaction so
+    sessions do not interleave statements. Worker processes never use it.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    # WAL is persistent for the database file; commits no longer need a full journal rewrite
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    # Read pages through a memory map instead of copying them via read() calls
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+@st.cache_resource
+def get_db_lock() -> threading.RLock:
+    """Return the lock guarding the shared connection (cached like the connection itself)"""
+    return threading.RLock()
+
+
+@contextmanager
+def db_transaction() -> Iterator[sqlite3.Connection]:
+    """Yield the shared connection inside one transaction, holding the app-wide lock.
+
+    All sessions share a single connection, so without the lock concurrent
+    ``with conn:`` blocks would merge into one transaction and a rollback could
+    undo another session's writes.
+    """
+    conn = get_connection()
+    with get_db_lock(), conn:
+        yield conn
 
 
 def init_db() -> None:
-    with sqlite3.connect(DB_PATH) as conn:
+    with db_transaction() as conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS teklifler (
@@ -115,16 +107,59 @@ def init_db() -> None:
                 subject TEXT,
                 amount REAL,
                 currency TEXT,
-                extracted_at TEXT
+                extracted_at TEXT,
+                mtime_ns INTEGER,
+                size INTEGER
+            )
+            """
+        )
+        # Databases created before the source file stamp columns existed get them added
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(teklifler)")}
+        for column in ("mtime_ns", "size"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE teklifler ADD COLUMN {column} INTEGER")
+        # Page texts of already parsed PDFs, valid while the file's mtime and size are
+        # unchanged and the same text backend is in use
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS teklif_cache (
+                file_path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size INTEGER,
+                pages BLOB,
+                backend TEXT,
+                version INTEGER
             )
             """
         )
+        # load_offers_frame orders by extraction time; load_summary groups by firm and subject and
+        # reads amount straight from the covering index, without a sort or table lookups
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_teklifler_extracted_at ON teklifler(extracted_at DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_teklifler_firm_subject_amount ON teklifler(firm, subject, amount)"
+        )
+        # The dashboard's per-currency totals group and sum straight from this covering index
+        # (its top-firm totals and firm count already scan the firm/subject/amount one)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_teklifler_currency_amount ON teklifler(currency, amount)"
+        )
+        # Refresh planner statistics when SQLite considers them stale (cheap otherwise)
+        conn.execute("PRAGMA optimize")
+
+
+@st.cache_resource
+def ensure_db_initialized() -> None:
+    """Run init_db once per process; the schema persists, so reruns can skip its statements"""
+    init_db()
 
 
 def reset_db() -> None:
-    """Clear all records from database without deleting the file"""
-    with sqlite3.connect(DB_PATH) as conn:
+    """Clear all records and cached page texts from database without deleting the file"""
+    with db_transaction() as conn:
         conn.execute("DELETE FROM teklifler")
+        conn.execute("DELETE FROM teklif_cache")
         conn.commit()
     logging.info("Veritabanı sıfırlandı.")
 
@@ -134,413 +169,178 @@ def standardize_existing_records() -> int:
 
     Returns the number of records updated.
     """
-    init_db()
-    updated_count = 0
-
-    with sqlite3.connect(DB_PATH) as conn:
-        # Use separate cursors: one for SELECT, one for UPDATE
-        # This prevents cursor conflict when iterating and updating simultaneously
-        select_cursor = conn.cursor()
-        update_cursor = conn.cursor()
+    ensure_db_initialized()
 
+    with db_transaction() as conn:
         # Fixed: Use correct column names from schema (firm, currency not firma, para_birimi)
-        select_cursor.execute("SELECT id, firm, currency FROM teklifler")
+        rows = conn.execute("SELECT id, firm, currency FROM teklifler").fetchall()
 
-        # Iterate over SELECT cursor, update with UPDATE cursor
-        for record_id, firm, currency in select_cursor:
+        # Collect changed rows and write them with a single executemany in this transaction
+        updates = []
+        for record_id, firm, currency in rows:
             # Standardize firm name
             normalized_firm = normalize_firm_name(firm) if firm else firm
 
             # Standardize currency using helper function
             normalized_currency = normalize_currency(currency)
 
-            # Update if changed (using separate cursor)
             if normalized_firm != firm or normalized_currency != currency:
-                update_cursor.execute(
-                    "UPDATE teklifler SET firm = ?, currency = ? WHERE id = ?",
-                    (normalized_firm, normalized_currency, record_id)
-                )
-                updated_count += 1
+                updates.append((normalized_firm, normalized_currency, record_id))
 
-        conn.commit()
+        conn.executemany("UPDATE teklifler SET firm = ?, currency = ? WHERE id = ?", updates)
+    updated_count = len(updates)
 
     logging.info(f"Standardizasyon tamamlandı: {updated_count} kayıt güncellendi.")
     return updated_count
 
 
-def extract_page_text(page, path: str, page_number: int) -> str:
+def read_file_bytes(path: str) -> bytes | None:
+    """Read a whole file; None lets the parser open the path itself and report the error"""
     try:
-        return sanitize_text(page.extract_text() or "")
-    except Exception as exc:  # noqa: BLE001
-        logging.warning(
-            "Sayfa metni okunamadı: %s (sayfa %s): %s",
-            path,
-            page_number,
-            sanitize_text(str(exc)),
-        )
-        return ""
-
-
-def load_pdf_reader(path: str) -> PdfReader | None:
-    try:
-        return PdfReader(path, strict=False)
-    except Exception as exc:  # noqa: BLE001
-        logging.warning("PDF okunamadı: %s (%s)", path, sanitize_text(str(exc)))
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
         return None
 
 
-def extract_text_from_pdf(path: str) -> str:
-    reader = load_pdf_reader(path)
-    if reader is None:
-        return ""
-    chunks: list[str] = []
-    for index, page in enumerate(reader.pages, start=1):
-        text = extract_page_text(page, path, index)
-        if text.strip():
-            chunks.append(text)
-    return "\n".join(chunks)
-
-
-def extract_pages_from_pdf(path: str) -> list[str]:
-    reader = load_pdf_reader(path)
-    if reader is None:
-        return []
-    chunks: list[str] = []
-    for index, page in enumerate(reader.pages, start=1):
-        text = extract_page_text(page, path, index)
-        chunks.append(text)
-    return chunks
-
+def prefetch_file_bytes(paths: list[str], window: int) -> Iterator[tuple[str, bytes | None]]:
+    """Yield (path, content) in order while a reader thread loads the next files.
 
-def sanitize_text(value: str) -> str:
-    # Remove surrogate characters and other problematic Unicode
-    return value.encode("utf-8", errors="surrogatepass").decode("utf-8", errors="replace")
+    Disk or network share latency then overlaps with parsing, and at most
+    ``window`` files are held in memory ahead of the consumer.
+    """
+    remaining = iter(paths)
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        ahead = deque((path, reader.submit(read_file_bytes, path)) for path in islice(remaining, window))
+        while ahead:
+            path, future = ahead.popleft()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                ahead.append((next_path, reader.submit(read_file_bytes, next_path)))
+            yield path, future.result()
+
+
+def get_unchanged_file_paths(paths: Iterable[str]) -> set[str]:
+    """Return the paths already in the database whose file is unchanged since it was saved.
+
+    A file counts as unchanged while its mtime and size match the stored ones.
+    Records saved before the stamps were stored have none and count as unchanged.
+    """
+    ensure_db_initialized()
+    with db_transaction() as conn:
+        stored = {
+            file_path: (mtime_ns, size)
+            for file_path, mtime_ns, size in conn.execute("SELECT file_path, mtime_ns, size FROM teklifler")
+        }
+    unchanged: set[str] = set()
+    for path in paths:
+        if path not in stored:
+            continue
+        stamp = stored[path]
+        if stamp == (None, None) or stamp == get_file_stamp(path):
+            unchanged.add(path)
+    return unchanged
 
 
-def normalize_currency(currency: str | None) -> str | None:
-    """Normalize currency code to uppercase standard format.
+def count_offers() -> int:
+    """Count stored offers without loading the rows"""
+    with db_transaction() as conn:
+        return conn.execute("SELECT COUNT(*) FROM teklifler").fetchone()[0]
 
-    Args:
-        currency: Raw currency string (e.g., "Eur", "€", "TL")
 
-    Returns:
-        Standardized currency code (e.g., "EUR", "TL", "USD") or None
-    """
-    if not currency:
-        return None
+def load_summary() -> list[tuple[str, str, float]]:
+    with db_transaction() as conn:
+        rows = conn.execute(
+            """
+            SELECT firm, subject, COALESCE(SUM(amount), 0)
+            FROM teklifler
+            GROUP BY firm, subject
+            ORDER BY firm, subject
+            """
+        ).fetchall()
+    return rows
 
-    currency_upper = currency.upper().strip()
-    if currency_upper in ("€", "EURO", "EUR"):
-        return "EUR"
-    if currency_upper in ("₺", "TL", "TRY"):
-        return "TL"
-    if currency_upper == "USD":
-        return "USD"
-    return currency_upper
 
+def load_offers_frame() -> pd.DataFrame:
+    """Load all offers column-wise straight into a DataFrame (newest first), without per-row objects"""
+    with db_transaction() as conn:
+        return pd.read_sql_query(
+            "SELECT file_path, firm, subject, amount, currency FROM teklifler ORDER BY extracted_at DESC",
+            conn,
+        )
 
-def normalize_firm_name(firm: str) -> str:
-    """Normalize firm name for consistency.
 
-    Applies title case but preserves common business abbreviations
-    like A.Ş, Ltd., Inc., etc. Uses pre-compiled regex patterns for performance.
-    """
-    if not firm or len(firm) <= 2:
-        return firm
-
-    # Apply title case
-    normalized = firm.title()
-
-    # Fix common abbreviations using pre-compiled patterns
-    for pattern, replacement in _COMPILED_ABBR_PATTERNS:
-        normalized = pattern.sub(replacement, normalized)
-
-    return normalized.strip()
-
-
-def extract_field(patterns: list[re.Pattern], text: str) -> str:
-    for pattern in patterns:
-        match = pattern.search(text)
-        if match:
-            value = match.group(1).strip()
-            # Split by newline or common field separators
-            value = re.split(r"\n|\r", value)[0].strip()
-            # Remove trailing noise - both Turkish and English stopwords
-            # Turkish: Referansınız, Teklif No, Tarih, Sayfa
-            # English: Your Reference, Offer No, Page, History, Topic
-            value = re.split(
-                r"\s+(?:Referans|Teklif\s*No|Tarih|Sayfa|Your|Offer|Page|History|Topic)",
-                value,
-                flags=re.IGNORECASE
-            )[0].strip()
-            return value
-    return ""
-
-
-def extract_firm(pages_text: list[str]) -> str:
-    if not pages_text:
-        return ""
-
-    # Try first 3 pages (in case first page is cover image)
-    for page_idx, page_text in enumerate(pages_text[:3]):
-        lines = [line.strip() for line in page_text.splitlines() if line.strip()]
-        if not lines:
-            continue  # Skip empty pages
-
-        # Try to find "Firma Adı:" or "Company Name:" in first 20 lines
-        for i, line in enumerate(lines[:20]):
-            # Search for both Turkish and English firm labels
-            if re.search(r"(?:Firma\s*Adı|Firma|Company\s*Name)\s*[:\-]", line, re.IGNORECASE):
-                logging.debug(f"Firma etiketi bulundu (sayfa {page_idx + 1}): {line}")
-                # Try to get firm name from same line after colon
-                match = re.search(r"(?:Firma\s*Adı|Firma|Company\s*Name)\s*[:\-]\s*(.+)", line, re.IGNORECASE)
-                if match:
-                    firm = match.group(1).strip()
-                    logging.debug(f"Aynı satırdan firma çıkartıldı (ham): {firm}")
-                    # Clean up trailing noise - both Turkish and English
-                    firm = re.split(
-                        r"\s+(?:Referans|Teklif\s*No|Tarih|Sayfa|Your|Offer|Page|History|Topic)",
-                        firm,
-                        flags=re.IGNORECASE
-                    )[0].strip()
-                    logging.debug(f"Temizlenmiş firma: {firm}")
-                    if firm and len(firm) > 2:
-                        return normalize_firm_name(firm)
-                # If not found on same line, check next line
-                if i + 1 < len(lines):
-                    firm = lines[i + 1].strip()
-                    logging.debug(f"Sonraki satırdan firma çıkartıldı: {firm}")
-                    firm = re.split(
-                        r"\s+(?:Referans|Teklif\s*No|Tarih|Sayfa|Your|Offer|Page|History|Topic)",
-                        firm,
-                        flags=re.IGNORECASE
-                    )[0].strip()
-                    if firm and len(firm) > 2:
-                        return normalize_firm_name(firm)
-
-        # Fallback to header block extraction for this page
-        header_block = "\n".join(lines[:12])
-        firm = extract_field(FIRM_PATTERNS, header_block)
-        if firm and len(firm) > 2:
-            logging.debug(f"Header block'tan firma (sayfa {page_idx + 1}): {firm}")
-            return normalize_firm_name(firm)
-
-        # Try greetings pattern
-        for line in lines[:15]:
-            match = GREETINGS_PATTERN.search(line)
-            if not match:
-                continue
-            candidate = match.group(1).strip()
-            if re.search(r"\b(hanım|bey)\b", candidate, re.IGNORECASE):
-                continue
-            if len(candidate) > 2:
-                logging.debug(f"Greetings pattern'den firma (sayfa {page_idx + 1}): {candidate}")
-                return normalize_firm_name(candidate)
-
-    logging.warning("Firma adı bulunamadı. İlk 3 sayfa kontrol edildi.")
-    return ""
-
-
-def extract_subject(pages_text: list[str]) -> str:
-    if not pages_text:
-        return ""
-
-    # Try first 3 pages (in case first page is cover image)
-    for page_idx, page_text in enumerate(pages_text[:3]):
-        lines = [line.strip() for line in page_text.splitlines() if line.strip()]
-        if not lines:
-            continue  # Skip empty pages
-
-        # Try to find "Konu:" label in first 25 lines
-        for i, line in enumerate(lines[:25]):
-            if re.search(r"(?:Konu|Teklif\s*Konusu)\s*[:\-]", line, re.IGNORECASE):
-                # Extract subject from same line or next line
-                match = re.search(r"(?:Konu|Teklif\s*Konusu)\s*[:\-]\s*(.+)", line, re.IGNORECASE)
-                if match:
-                    subject = match.group(1).strip()
-                    return subject[:200]  # Max 200 chars
-                # Check next line if not on same line
-                if i + 1 < len(lines):
-                    return lines[i + 1].strip()[:200]
-
-        # Fallback to header block
-        header_block = "\n".join(lines[:18])
-        subject = extract_field(SUBJECT_PATTERNS, header_block)
-        if subject:
-            return subject
-
-    return ""
-
-
-def parse_amount(raw_amount: str, currency: str | None) -> tuple[float | None, str | None]:
-    # Turkish format: 27.560,50 or 27.560 or "1.677 289,00" (dot/space=thousands, comma=decimal)
-    # English format: 27,560.50 or 27.560 (comma=thousands, dot=decimal)
-
-    # Remove all spaces first (support formats like "1.677 289,00")
-    raw_amount = raw_amount.replace(" ", "").strip()
-
-    # Reject amounts that are too small (likely noise like "1.00", "2.00")
-    if len(raw_amount.replace(".", "").replace(",", "")) < 3:
-        return None, None
-
-    # If both comma and dot exist, determine which is decimal separator
-    if "," in raw_amount and "." in raw_amount:
-        # Check which comes last (that's the decimal separator)
-        last_comma_pos = raw_amount.rfind(",")
-        last_dot_pos = raw_amount.rfind(".")
-        if last_comma_pos > last_dot_pos:
-            # Turkish: dot=thousands, comma=decimal (e.g., 1.234,56)
-            normalized = raw_amount.replace(".", "").replace(",", ".")
-        else:
-            # English: comma=thousands, dot=decimal (e.g., 1,234.56)
-            normalized = raw_amount.replace(",", "")
-    elif "," in raw_amount:
-        # Only comma - assume Turkish decimal separator (e.g., 1234,56)
-        normalized = raw_amount.replace(",", ".")
-    elif "." in raw_amount:
-        # Only dot - check if it's thousands or decimal separator
-        parts = raw_amount.split(".")
-        # If last part has exactly 3 digits, it's likely thousands separator (e.g., 27.560)
-        if len(parts) > 1 and len(parts[-1]) == 3:
-            # Turkish thousands separator (e.g., 27.560 = 27560)
-            normalized = raw_amount.replace(".", "")
-        else:
-            # Decimal separator (e.g., 27.5 or 27.56)
-            normalized = raw_amount
-    else:
-        normalized = raw_amount
+def get_db_version() -> tuple[tuple[int, int] | None, tuple[int, int] | None]:
+    """Return a key that changes whenever the database is written.
 
-    try:
-        amount = float(normalized)
-        # Normalize currency using helper function
-        normalized_currency = normalize_currency(currency)
-        return amount, normalized_currency
-    except ValueError:
-        return None, None
-
-
-def extract_amount_from_pages(pages_text: list[str]) -> tuple[float | None, str | None]:
-    for pattern in AMOUNT_PATTERNS:
-        for page_text in pages_text:
-            match = pattern.search(page_text)
-            if not match:
-                continue
-            raw_amount = match.group(1).strip()
-            currency = match.group(2) if match.lastindex and match.lastindex >= 2 else None
-            amount, normalized_currency = parse_amount(raw_amount, currency)
-            if amount is not None:
-                return amount, normalized_currency
-    return None, None
-
-
-def looks_like_offer(firm: str, subject: str, amount: float | None) -> bool:
-    """Check if extracted data looks like a valid offer.
-
-    Requires at least 2 out of 3 fields (firm, subject, amount) to be found.
-    This prevents random PDFs from being classified as offers.
+    With WAL, commits land in the -wal file and reach the main file only on
+    checkpoints, so both files' mtime and size are part of the key.
     """
-    found_fields = 0
+    return get_file_stamp(DB_PATH), get_file_stamp(DB_PATH + "-wal")
 
-    if firm and len(firm) > 2:
-        found_fields += 1
-    if subject and len(subject) > 2:
-        found_fields += 1
-    if amount is not None:
-        found_fields += 1
 
-    # Accept if we found at least 2 out of 3 key fields
-    return found_fields >= 2
+@st.cache_data(show_spinner=False, max_entries=1)
+def cached_offers_frame(db_version: tuple) -> pd.DataFrame:
+    """load_offers_frame memoized per database version (see get_db_version)"""
+    return load_offers_frame()
 
 
-def parse_offer(path: str) -> OfferRecord | None:
-    pages_text = extract_pages_from_pdf(path)
-    firm = extract_firm(pages_text)
-    subject = extract_subject(pages_text)
-    amount, currency = extract_amount_from_pages(pages_text)
-    if not looks_like_offer(firm, subject, amount):
-        return None
-    return OfferRecord(
-        file_path=path,
-        firm=firm,
-        subject=subject,
-        amount=amount,
-        currency=currency,
-    )
+def get_offers_dataframe(frame: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Get all offers as pandas DataFrame for Excel export (pass an already loaded frame to skip the query)"""
+    if frame is None:
+        frame = load_offers_frame()
+    if frame.empty:
+        return pd.DataFrame()
 
-
-def save_offer(record: OfferRecord) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO teklifler (file_path, firm, subject, amount, currency, extracted_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                record.file_path,
-                record.firm,
-                record.subject,
-                record.amount,
-                record.currency,
-                datetime.now().isoformat(timespec="seconds"),
-            ),
-        )
+    return pd.DataFrame({
+        "Firma": frame["firm"],
+        "Konu": frame["subject"],
+        "Tutar": frame["amount"].astype(float).fillna(0),
+        "Para Birimi": frame["currency"].fillna(""),
+        "Dosya Yolu": frame["file_path"],
+    })
 
 
-def get_existing_file_paths() -> set[str]:
-    """Get set of file paths that are already in the database.
+def build_offers_xlsx(df: pd.DataFrame) -> bytes:
+    """Write the export frame to an in-memory .xlsx file (sheet "Teklifler").
 
-    Returns:
-        Set of absolute file paths already processed
+    openpyxl's write-only mode streams rows to the file instead of keeping a
+    Cell object for every value, so memory stays flat as the table grows.
     """
-    init_db()
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT file_path FROM teklifler")
-        return {row[0] for row in cursor.fetchall()}
-
-
-def load_offers() -> list[OfferRecord]:
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            "SELECT file_path, firm, subject, amount, currency FROM teklifler ORDER BY extracted_at DESC"
-        ).fetchall()
-    return [OfferRecord(*row) for row in rows]
-
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
 
-def load_summary() -> list[tuple[str, str, float]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            """
-            SELECT firm, subject, COALESCE(SUM(amount), 0)
-            FROM teklifler
-            GROUP BY firm, subject
-            ORDER BY firm, subject
-            """
-        ).fetchall()
-    return rows
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Teklifler")
+    # Bold header row, like DataFrame.to_excel
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(sheet, value=column)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    sheet.append(header)
+    for row in df.itertuples(index=False, name=None):
+        sheet.append(row)
 
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
 
-def get_offers_dataframe() -> pd.DataFrame:
-    """Get all offers as pandas DataFrame for Excel export"""
-    offers = load_offers()
-    if not offers:
-        return pd.DataFrame()
 
-    data = {
-        "Firma": [o.firm for o in offers],
-        "Konu": [o.subject for o in offers],
-        "Tutar": [o.amount if o.amount is not None else 0 for o in offers],
-        "Para Birimi": [o.currency or "" for o in offers],
-        "Dosya Yolu": [o.file_path for o in offers],
-    }
-    return pd.DataFrame(data)
+@st.cache_data(show_spinner=False, max_entries=1)
+def cached_offers_xlsx(db_version: tuple) -> bytes:
+    """Excel export of all offers memoized per database version (see get_db_version)"""
+    return build_offers_xlsx(get_offers_dataframe(cached_offers_frame(db_version)))
 
 
 def get_dashboard_stats() -> dict:
     """Get statistics for dashboard"""
-    with sqlite3.connect(DB_PATH) as conn:
-        total_offers = conn.execute("SELECT COUNT(*) FROM teklifler").fetchone()[0]
-        total_firms = conn.execute("SELECT COUNT(DISTINCT firm) FROM teklifler WHERE firm != ''").fetchone()[0]
+    with db_transaction() as conn:
+        # Both counts from one scan; the CASE leaves empty firm names out of the distinct count
+        total_offers, total_firms = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT CASE WHEN firm != '' THEN firm END) FROM teklifler"
+        ).fetchone()
 
         # Amount by currency
         amounts_by_currency = conn.execute(
@@ -573,12 +373,40 @@ def get_dashboard_stats() -> dict:
     }
 
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def cached_dashboard_stats(db_version: tuple) -> dict:
+    """get_dashboard_stats memoized per database version (see get_db_version)"""
+    return get_dashboard_stats()
+
+
 def walk_pdf_files(folder: str) -> list[str]:
+    """Collect PDF files under folder in the same order as a top-down os.walk.
+
+    Uses os.scandir directly so directory entries carry their file type and the
+    tree is walked without the per-directory bookkeeping of os.walk.
+    """
     pdf_files: list[str] = []
-    for root, _, files in os.walk(folder):
-        for file in files:
-            if file.lower().endswith(".pdf"):
-                pdf_files.append(os.path.join(root, file))
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        subdirs: list[str] = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, do not descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(_PDF_SUFFIXES):
+                        pdf_files.append(entry.path)
+        except OSError:
+            continue
+        # Reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
     return pdf_files
 
 
@@ -586,25 +414,6 @@ def is_offer_folder(name: str) -> bool:
     return bool(OFFER_FOLDER_PATTERN.search(name))
 
 
-def iter_offer_folders(root_folder: str) -> Iterable[str]:
-    if not os.path.isdir(root_folder):
-        return []
-    for entry in os.listdir(root_folder):
-        company_path = os.path.join(root_folder, entry)
-        if not os.path.isdir(company_path):
-            continue
-        offers_folder = None
-        for sub_entry in os.listdir(company_path):
-            if is_offer_folder(sub_entry):
-                offers_folder = os.path.join(company_path, sub_entry)
-                break
-        if offers_folder and os.path.isdir(offers_folder):
-            logging.info("Teklif klasörü bulundu: %s", offers_folder)
-            yield offers_folder
-        else:
-            logging.info("Teklif klasörü bulunamadı: %s", company_path)
-
-
 def scan_company_offer_pdfs(root_folder: str) -> list[str]:
     """Scan for PDF files in offer folders at depths 0-3.
 
@@ -630,17 +439,21 @@ def scan_company_offer_pdfs(root_folder: str) -> list[str]:
         if current_depth > max_depth:
             return teklif_folders
 
+        subdirs: list[tuple[str, str]] = []
         try:
-            entries = os.listdir(base_path)
-        except (PermissionError, OSError):
+            # scandir entries carry their file type, so is_dir() needs no extra stat call
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    # An unreadable entry is skipped without losing its siblings
+                    try:
+                        if entry.is_dir():
+                            subdirs.append((entry.name, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
             return teklif_folders
 
-        for entry in entries:
-            entry_path = os.path.join(base_path, entry)
-
-            if not os.path.isdir(entry_path):
-                continue
-
+        for entry, entry_path in subdirs:
             # Check if this folder matches the teklif pattern
             if is_offer_folder(entry):
                 logging.info("Teklif klasörü bulundu (seviye %d): %s", current_depth, entry_path)
@@ -660,79 +473,314 @@ def scan_company_offer_pdfs(root_folder: str) -> list[str]:
         # Search subdirectories at depths 1, 2, and 3
         teklif_folders = find_teklif_folders(root_folder, 1, 3)
 
-    # Scan PDFs in each teklif folder
-    for teklif_folder in teklif_folders:
-        pdfs_in_folder = walk_pdf_files(teklif_folder)
-        pdf_files.extend(pdfs_in_folder)
+    # Scan PDFs in each teklif folder. A teklif folder nested inside another one
+    # is walked twice, so keep each PDF only the first time it is seen.
+    # The folders are walked concurrently so listing latency overlaps; map keeps their order.
+    seen: set[str] = set()
+    with ThreadPoolExecutor(max_workers=FOLDER_SCAN_WORKERS) as walker:
+        walked = list(walker.map(walk_pdf_files, teklif_folders))
+    for teklif_folder, pdfs_in_folder in zip(teklif_folders, walked):
+        new_pdfs = [path for path in pdfs_in_folder if path not in seen]
+        seen.update(new_pdfs)
+        pdf_files.extend(new_pdfs)
         logging.info("  → %s PDF bulundu: %s", len(pdfs_in_folder), teklif_folder)
 
     logging.info("Toplam %s teklif klasöründe %s PDF bulundu.", len(teklif_folders), len(pdf_files))
     return pdf_files
 
 
+def get_file_stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) identifying the file's current content, or None if unreadable"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def iter_chunks(items: list[str], size: int = SQL_PARAM_CHUNK_SIZE) -> Iterator[list[str]]:
+    """Yield consecutive slices of ``items`` holding at most ``size`` entries"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def load_page_cache(stamps: dict[str, tuple[int, int]]) -> dict[str, list[str]]:
+    """Return cached page texts for files whose mtime and size still match.
+
+    Only rows for the requested paths written by the current backend and parser
+    version are considered; blobs are read for the hits alone.
+    """
+    cached: dict[str, list[str]] = {}
+    rows: list[tuple[str, bytes]] = []
+    try:
+        with db_transaction() as conn:
+            hits: list[str] = []
+            for chunk in iter_chunks(list(stamps)):
+                placeholders = ",".join("?" * len(chunk))
+                hits.extend(
+                    file_path
+                    for file_path, mtime_ns, size in conn.execute(
+                        "SELECT file_path, mtime_ns, size FROM teklif_cache "
+                        f"WHERE backend = ? AND version = ? AND file_path IN ({placeholders})",
+                        (PAGE_TEXT_BACKEND, PAGE_CACHE_VERSION, *chunk),
+                    )
+                    if stamps[file_path] == (mtime_ns, size)
+                )
+            for chunk in iter_chunks(hits):
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(f"SELECT file_path, pages FROM teklif_cache WHERE file_path IN ({placeholders})", chunk)
+                )
+    except sqlite3.Error as exc:
+        logging.warning("Metin önbelleği okunamadı: %s", exc)
+        return cached
+    for file_path, blob in rows:
+        try:
+            cached[file_path] = json.loads(zlib.decompress(blob).decode("utf-8"))
+        except (zlib.error, ValueError) as exc:
+            logging.warning("Önbellek kaydı bozuk: %s (%s)", file_path, exc)
+    return cached
+
+
+def save_page_cache(entries: list[tuple[str, tuple[int, int], list[str]]]) -> None:
+    """Store decoded page texts (compressed JSON) keyed by file path, mtime, size, backend and parser version"""
+    rows = [
+        (
+            path,
+            mtime_ns,
+            size,
+            zlib.compress(json.dumps(pages, ensure_ascii=False).encode("utf-8")),
+            PAGE_TEXT_BACKEND,
+            PAGE_CACHE_VERSION,
+        )
+        for path, (mtime_ns, size), pages in entries
+    ]
+    if not rows:
+        return
+    try:
+        with db_transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO teklif_cache (file_path, mtime_ns, size, pages, backend, version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+    except sqlite3.Error as exc:
+        logging.warning("Metin önbelleği yazılamadı: %s", exc)
+
+
+def prune_page_cache(root_folder: str, found_paths: Iterable[str]) -> None:
+    """Drop cached page texts of files under ``root_folder`` that the latest scan no longer found"""
+    prefix = os.path.join(root_folder, "")
+    found = set(found_paths)
+    try:
+        with db_transaction() as conn:
+            stale = [
+                (file_path,)
+                for (file_path,) in conn.execute("SELECT file_path FROM teklif_cache")
+                if file_path.startswith(prefix) and file_path not in found
+            ]
+            if stale:
+                conn.executemany("DELETE FROM teklif_cache WHERE file_path = ?", stale)
+    except sqlite3.Error as exc:
+        logging.warning("Metin önbelleği temizlenemedi: %s", exc)
+        return
+    if stale:
+        logging.info("Metin önbelleğinden %d eski kayıt silindi.", len(stale))
+
+
+def start_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Start a parser process pool.
+
+    Workers are always spawned, never forked: a fork copies locks that other threads
+    of the Streamlit server hold at that moment (e.g. the log file's), so a forked
+    worker can block forever. Spawned workers begin with unconfigured logging, so
+    each one sets up the app log first.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=partial(logging.basicConfig, **LOG_CONFIG),
+    )
+
+
 def process_files(
     paths: list[str],
     progress_callback: Callable[[float], None] | None = None,
     status_callback: Callable[[str], None] | None = None,
 ) -> tuple[list[OfferRecord], list[str]]:
-    """Parse PDF files and return list of offers (does NOT save to DB)"""
-    records: list[OfferRecord] = []
-    errors: list[str] = []
-    total = len(paths)
+    """Parse PDF files and return list of offers (does NOT save to DB).
 
-    for index, path in enumerate(paths, start=1):
+    PDF text extraction is CPU-bound, so files are parsed in parallel with a
+    process pool while a reader thread prefetches file contents. Files unchanged since an earlier scan reuse their cached page
+    texts (see teklif_cache). Results are returned in the same order as ``paths``.
+    When a worker dies, the files it took down are retried one by one in fresh workers,
+    so only the file that crashes it is reported as failed.
+    """
+    total = len(paths)
+    results: list[tuple[OfferRecord | None, str | None, list[str]]] = [(None, None, [])] * total
+    done = 0
+    last_report = 0.0
+
+    def report(index: int, verb: str) -> None:
+        # Each callback is a UI round-trip; coalesce to the latest state every
+        # PROGRESS_INTERVAL_SECONDS and always show the final one
+        nonlocal done, last_report
+        done += 1
+        now = time.monotonic()
+        if done < total and now - last_report < PROGRESS_INTERVAL_SECONDS:
+            return
+        last_report = now
         if status_callback:
-            status_callback(f"{index}/{total} • {os.path.basename(path)} işleniyor...")
+            status_callback(f"{done}/{total} • {os.path.basename(paths[index])} {verb}")
+        if progress_callback:
+            progress_callback(done / total)
+
+    # Unchanged files are parsed from cached page texts without opening the PDF
+    stamps = {path: stamp for path in paths if (stamp := get_file_stamp(path)) is not None}
+    cached_pages = load_page_cache(stamps)
+    pending: list[int] = []
+    for index, path in enumerate(paths):
+        if path in cached_pages:
+            results[index] = parse_offer_safe(path, cached_pages[path])
+            report(index, "önbellekten okundu")
+        else:
+            pending.append(index)
+
+    # File contents are read ahead by a thread so I/O overlaps with parsing
+    max_workers = min(os.cpu_count() or 1, MAX_PARSE_WORKERS, len(pending))
+    prefetched = zip(pending, prefetch_file_bytes([paths[index] for index in pending], 2 * max(max_workers, 1)))
+    if max_workers <= 1:
+        for index, (path, data) in prefetched:
+            results[index] = parse_offer_safe(path, data=data)
+            report(index, "işlendi")
+    else:
+        executor = start_parse_pool(max_workers)
+        in_flight: dict[Future, tuple[int, bytes | None]] = {}
+        # Files in flight when a worker died: the broken pool fails all of them, not just the culprit
+        suspects: list[tuple[int, bytes | None]] = []
+
+        def fail(index: int, exc: Exception) -> None:
+            logging.error("Dosya işlenemedi: %s - %s", paths[index], exc)
+            results[index] = (None, f"{os.path.basename(paths[index])}: {sanitize_text(str(exc))}", [])
+
+        def collect(futures: Iterable[Future]) -> None:
+            for future in futures:
+                index, data = in_flight.pop(future)
+                try:
+                    results[index] = future.result()
+                except BrokenProcessPool:
+                    suspects.append((index, data))
+                    continue
+                except Exception as exc:  # noqa: BLE001
+                    fail(index, exc)
+                report(index, "işlendi")
+
+        def retry_suspects() -> None:
+            # Retry each file the crash took down once, alone in a fresh worker, so only
+            # the file that really kills its worker is reported as failed
+            collect(wait(in_flight).done)
+            executor.shutdown()
+            if suspects:
+                logging.warning("Ayrıştırma süreci çöktü, %d dosya yeniden deneniyor.", len(suspects))
+            for index, data in suspects:
+                with start_parse_pool(1) as solo:
+                    try:
+                        results[index] = solo.submit(parse_offer_safe, paths[index], None, data).result()
+                    except Exception as exc:  # noqa: BLE001
+                        fail(index, exc)
+                report(index, "işlendi")
+            suspects.clear()
 
         try:
-            record = parse_offer(path)
-            if record is not None:
-                records.append(record)
-        except Exception as exc:  # noqa: BLE001
-            logging.exception("Dosya işlenemedi: %s", path)
-            error_text = sanitize_text(str(exc))
-            errors.append(f"{os.path.basename(path)}: {error_text}")
-
-        if progress_callback:
-            progress_callback(index / total if total else 1.0)
+            for index, (path, data) in prefetched:
+                # Bound the file contents waiting in the pool to two per worker
+                if len(in_flight) >= 2 * max_workers:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                if suspects:
+                    retry_suspects()
+                    executor = start_parse_pool(max_workers)
+                try:
+                    future = executor.submit(parse_offer_safe, path, None, data)
+                except BrokenProcessPool:
+                    retry_suspects()
+                    executor = start_parse_pool(max_workers)
+                    future = executor.submit(parse_offer_safe, path, None, data)
+                in_flight[future] = (index, data)
+            collect(wait(in_flight).done)
+            if suspects:
+                retry_suspects()
+        finally:
+            executor.shutdown()
+
+    save_page_cache([
+        (paths[index], stamps[paths[index]], results[index][2])
+        for index in pending
+        if paths[index] in stamps and results[index][1] is None and results[index][2]
+    ])
 
+    records = [record for record, _, _ in results if record is not None]
+    errors = [error for _, error, _ in results if error is not None]
     return records, errors
 
 
 def save_offers_batch(records: list[OfferRecord]) -> int:
-    """Save multiple offers to database at once"""
-    saved = 0
-    with sqlite3.connect(DB_PATH) as conn:
-        for record in records:
+    """Save multiple offers to database in a single transaction"""
+    extracted_at = datetime.now().isoformat(timespec="seconds")
+    rows = []
+    for record in records:
+        # Stored so later scans can tell whether the PDF changed since it was saved
+        mtime_ns, size = get_file_stamp(record.file_path) or (None, None)
+        rows.append(
+            (record.file_path, record.firm, record.subject, record.amount, record.currency, extracted_at, mtime_ns, size)
+        )
+    sql = """
+        INSERT OR REPLACE INTO teklifler (file_path, firm, subject, amount, currency, extracted_at, mtime_ns, size)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    with db_transaction() as conn:
+        try:
+            conn.executemany(sql, rows)
+            return len(rows)
+        except sqlite3.Error as exc:
+            # Fall back to row-by-row inserts so one bad record doesn't drop the batch
+            logging.warning("Toplu kayıt başarısız, tek tek deneniyor: %s", exc)
+            conn.rollback()
+
+        saved = 0
+        for row in rows:
             try:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO teklifler (file_path, firm, subject, amount, currency, extracted_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record.file_path,
-                        record.firm,
-                        record.subject,
-                        record.amount,
-                        record.currency,
-                        datetime.now().isoformat(timespec="seconds"),
-                    ),
-                )
+                conn.execute(sql, row)
                 saved += 1
             except Exception as exc:  # noqa: BLE001
-                logging.error("Kayıt başarısız: %s - %s", record.file_path, exc)
-    return saved
+                logging.error("Kayıt başarısız: %s - %s", row[0], exc)
+        return saved
 
 
 def read_log_tail(max_lines: int = 200) -> str:
     if not os.path.exists(LOG_PATH):
         return "Log dosyası henüz oluşmadı."
-    with open(LOG_PATH, "r", encoding="utf-8", errors="replace") as log_file:
-        lines = log_file.readlines()
+    # Read backwards from the end until enough lines are in hand, so the cost
+    # does not grow with the log file
+    with open(LOG_PATH, "rb") as log_file:
+        position = log_file.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= max_lines:
+            block_size = min(LOG_TAIL_BLOCK_SIZE, position)
+            position -= block_size
+            log_file.seek(position)
+            data = log_file.read(block_size) + data
+    lines = TextIOWrapper(BytesIO(data), encoding="utf-8", errors="replace").readlines()
+    if position > 0:
+        lines = lines[1:]  # The first line was cut by the block boundary
     return "".join(lines[-max_lines:]) or "Log dosyası boş."
 
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def cached_log_tail(max_lines: int, log_stamp: tuple[int, int] | None) -> str:
+    """read_log_tail memoized until the log file's mtime or size changes (see get_file_stamp)"""
+    return read_log_tail(max_lines=max_lines)
+
+
 def render_home_page() -> None:
     """Ana sayfa: PDF tarama ve önizleme"""
     st.header("📄 Teklif PDF Tarama")
@@ -740,12 +788,18 @@ def render_home_page() -> None:
     # Initialize session state for parsed offers
     if "parsed_offers" not in st.session_state:
         st.session_state.parsed_offers = []
-    if "selected_indices" not in st.session_state:
-        st.session_state.selected_indices = []
+    # The selection table starts with every row set to this value; bumping the
+    # generation gives the table a new key, so it drops the user's toggles
+    if "selection_default" not in st.session_state:
+        st.session_state.selection_default = True
+    if "selection_generation" not in st.session_state:
+        st.session_state.selection_generation = 0
+    if "select_all" not in st.session_state:
+        st.session_state.select_all = True
 
     # Database management section
     with st.expander("🗑️ Veritabanı Yönetimi"):
-        offers_count = len(load_offers())
+        offers_count = count_offers()
         st.write(f"**Veritabanında {offers_count} teklif var**")
 
         if offers_count > 0:
@@ -790,14 +844,15 @@ def render_home_page() -> None:
 
         logging.info("Klasör taraması başlatıldı: %s", folder)
         pdf_files = scan_company_offer_pdfs(folder)
+        prune_page_cache(folder, pdf_files)
 
         if not pdf_files:
             st.warning("Teklif klasörlerinde PDF bulunamadı.")
             return
 
-        # Filter out PDFs that are already in database
-        existing_paths = get_existing_file_paths()
-        new_pdf_files = [path for path in pdf_files if path not in existing_paths]
+        # Filter out PDFs that are already in database and unchanged since they were saved
+        unchanged_paths = get_unchanged_file_paths(pdf_files)
+        new_pdf_files = [path for path in pdf_files if path not in unchanged_paths]
         already_processed_count = len(pdf_files) - len(new_pdf_files)
 
         # Show info about new vs existing PDFs
@@ -805,7 +860,7 @@ def render_home_page() -> None:
             st.info(
                 f"📊 Toplam {len(pdf_files)} PDF bulundu. "
                 f"{already_processed_count} tanesi zaten veritabanında. "
-                f"Sadece {len(new_pdf_files)} yeni PDF işlenecek."
+                f"Sadece {len(new_pdf_files)} yeni veya değişmiş PDF işlenecek."
             )
 
         if not new_pdf_files:
@@ -823,109 +878,102 @@ def render_home_page() -> None:
 
         status_area.success(f"✅ Tarama tamamlandı! {len(records)} yeni teklif bulundu.")
         st.session_state.parsed_offers = records
-        st.session_state.selected_indices = list(range(len(records)))  # Select all by default
+        # Select all by default
+        st.session_state.selection_default = True
+        st.session_state.select_all = True
+        st.session_state.selection_generation += 1
 
         if errors:
             with st.expander("⚠️ Hatalar"):
                 st.error("\n\n".join(errors))
 
-    # Display parsed offers in table with checkboxes
+    # Display parsed offers in one table with a selection column
     if st.session_state.parsed_offers:
         st.divider()
-        st.subheader(f"📋 Bulunan Teklifler ({len(st.session_state.parsed_offers)})")
+        render_offer_selection()
 
-        # Select all checkbox
-        select_all = st.checkbox(
-            "🔘 Tümünü Seç / Seçimi Kaldır",
-            value=len(st.session_state.selected_indices) == len(st.session_state.parsed_offers),
-            key="select_all",
-        )
 
-        if select_all:
-            st.session_state.selected_indices = list(range(len(st.session_state.parsed_offers)))
-        else:
-            if len(st.session_state.selected_indices) == len(st.session_state.parsed_offers):
-                st.session_state.selected_indices = []
-
-        # Display offers in table format
-        for idx, offer in enumerate(st.session_state.parsed_offers):
-            col_check, col_firm, col_subject, col_amount = st.columns([1, 3, 4, 2])
-
-            with col_check:
-                is_selected = st.checkbox(
-                    "Seç",
-                    value=idx in st.session_state.selected_indices,
-                    key=f"check_{idx}",
-                    label_visibility="collapsed",
-                )
-                if is_selected and idx not in st.session_state.selected_indices:
-                    st.session_state.selected_indices.append(idx)
-                elif not is_selected and idx in st.session_state.selected_indices:
-                    st.session_state.selected_indices.remove(idx)
-
-            with col_firm:
-                st.write(f"**{offer.firm or '(Firma bulunamadı)'}**")
-
-            with col_subject:
-                st.write(offer.subject or "(Konu bulunamadı)")
-
-            with col_amount:
-                if offer.amount:
-                    st.write(f"**{offer.amount:,.2f} {offer.currency or ''}**")
-                else:
-                    st.write("(Tutar bulunamadı)")
-
-            # File path in small text
-            st.caption(f"📁 {os.path.basename(offer.file_path)}")
-            st.divider()
-
-        # Save button
-        st.write(f"**Seçili: {len(st.session_state.selected_indices)} / {len(st.session_state.parsed_offers)}**")
-
-        if st.button(
-            f"💾 Seçili {len(st.session_state.selected_indices)} Teklifi DB'ye Ekle",
-            type="primary",
-            use_container_width=True,
-            disabled=len(st.session_state.selected_indices) == 0,
-        ):
-            selected_offers = [
-                st.session_state.parsed_offers[i] for i in st.session_state.selected_indices
-            ]
-            saved = save_offers_batch(selected_offers)
-            st.success(f"✅ {saved} teklif veritabanına eklendi!")
-            st.session_state.parsed_offers = []
-            st.session_state.selected_indices = []
-            st.rerun()
+@st.experimental_fragment
+def render_offer_selection() -> None:
+    """Scanned offers with their selection table and save button.
+
+    Runs as a fragment: toggling rows reruns only this block, not the whole app
+    (sidebar log, database counts). st.rerun() after saving reruns everything.
+    """
+    parsed_offers = st.session_state.parsed_offers
+    st.subheader(f"📋 Bulunan Teklifler ({len(parsed_offers)})")
+
+    def on_select_all_change():
+        st.session_state.selection_default = st.session_state.select_all
+        st.session_state.selection_generation += 1
+
+    # Select all checkbox: resets every row of the table to its value
+    st.checkbox(
+        "🔘 Tümünü Seç / Seçimi Kaldır",
+        key="select_all",
+        on_change=on_select_all_change,
+    )
+
+    # A single data_editor instead of one checkbox widget per offer
+    selection_df = pd.DataFrame({
+        "Seç": [st.session_state.selection_default] * len(parsed_offers),
+        "Firma": [offer.firm or "(Firma bulunamadı)" for offer in parsed_offers],
+        "Konu": [offer.subject or "(Konu bulunamadı)" for offer in parsed_offers],
+        "Tutar": pd.Series([offer.amount or None for offer in parsed_offers], dtype=float),
+        "Para Birimi": [offer.currency or "" for offer in parsed_offers],
+        "Dosya": [os.path.basename(offer.file_path) for offer in parsed_offers],
+    })
+    edited_selection = st.data_editor(
+        selection_df,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Seç": st.column_config.CheckboxColumn("Seç"),
+            "Tutar": st.column_config.NumberColumn("Tutar", format="%.2f"),
+        },
+        disabled=["Firma", "Konu", "Tutar", "Para Birimi", "Dosya"],
+        num_rows="fixed",
+        key=f"offer_selection_{st.session_state.selection_generation}",
+    )
+    selected_indices = edited_selection.index[edited_selection["Seç"]].tolist()
+
+    # Save button
+    st.write(f"**Seçili: {len(selected_indices)} / {len(parsed_offers)}**")
+
+    if st.button(
+        f"💾 Seçili {len(selected_indices)} Teklifi DB'ye Ekle",
+        type="primary",
+        use_container_width=True,
+        disabled=len(selected_indices) == 0,
+    ):
+        selected_offers = [parsed_offers[i] for i in selected_indices]
+        saved = save_offers_batch(selected_offers)
+        st.success(f"✅ {saved} teklif veritabanına eklendi!")
+        st.session_state.parsed_offers = []
+        st.rerun()
 
 
 def render_tekliflerim_page() -> None:
     """Tekliflerim sayfası: DB'deki tüm teklifler + Excel export"""
     st.header("📋 Tekliflerim")
 
-    offers = load_offers()
+    db_version = get_db_version()
+    offers = cached_offers_frame(db_version)
 
-    if not offers:
+    if offers.empty:
         st.info("Henüz veritabanında teklif yok. Ana sayfadan PDF tarayın ve ekleyin.")
         return
 
     st.write(f"**Toplam {len(offers)} teklif**")
 
-    # Excel export button
-    df = get_offers_dataframe()
-    if not df.empty:
-        # Convert to Excel in memory
-        from io import BytesIO
-
-        buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Teklifler")
-
-        st.download_button(
-            label="📥 Excel Olarak İndir",
-            data=buffer.getvalue(),
-            file_name="teklifler.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
+    # Excel export button; the file is only rebuilt after the database changes,
+    # not on every rerun (download_button needs the bytes up front)
+    st.download_button(
+        label="📥 Excel Olarak İndir",
+        data=cached_offers_xlsx(db_version),
+        file_name="teklifler.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
 
     st.divider()
 
@@ -933,18 +981,15 @@ def render_tekliflerim_page() -> None:
     st.subheader("✏️ Teklifler (Düzenlenebilir)")
     st.info("💡 Tablodaki değerleri doğrudan düzenleyebilirsiniz. Değişiklikleri kaydetmek için 'Değişiklikleri Kaydet' butonuna basın.")
 
-    # Prepare editable dataframe with IDs
-    df_edit = pd.DataFrame([
-        {
-            "ID": o.file_path,  # Use file_path as unique ID
-            "Firma": o.firm or "",
-            "Konu": o.subject or "",
-            "Tutar": float(o.amount) if o.amount is not None else 0.0,
-            "Para Birimi": o.currency or "EUR",
-            "Dosya": os.path.basename(o.file_path),
-        }
-        for o in offers
-    ])
+    # Prepare editable dataframe with IDs (built column-wise from the loaded frame)
+    df_edit = pd.DataFrame({
+        "ID": offers["file_path"],  # Use file_path as unique ID
+        "Firma": offers["firm"].fillna(""),
+        "Konu": offers["subject"].fillna(""),
+        "Tutar": offers["amount"].astype(float).fillna(0.0),
+        "Para Birimi": offers["currency"].fillna("").replace("", "EUR"),
+        "Dosya": offers["file_path"].map(os.path.basename),
+    })
 
     # Editable data editor
     edited_df = st.data_editor(
@@ -969,20 +1014,26 @@ def render_tekliflerim_page() -> None:
     # Save changes button
     if st.button("💾 Değişiklikleri Kaydet", type="primary"):
         with st.spinner("Değişiklikler kaydediliyor..."):
-            updated_count = 0
-            with sqlite3.connect(DB_PATH) as conn:
-                for idx, row in edited_df.iterrows():
-                    file_path = row["ID"]
-                    conn.execute(
-                        """
-                        UPDATE teklifler
-                        SET firm = ?, subject = ?, amount = ?, currency = ?
-                        WHERE file_path = ?
-                        """,
-                        (row["Firma"], row["Konu"], row["Tutar"], row["Para Birimi"], file_path)
-                    )
-                    updated_count += 1
-                conn.commit()
+            rows = list(
+                zip(
+                    edited_df["Firma"],
+                    edited_df["Konu"],
+                    edited_df["Tutar"].astype(float),
+                    edited_df["Para Birimi"],
+                    edited_df["ID"],
+                )
+            )
+            # One batched statement in a single transaction instead of a Python loop over iterrows
+            with db_transaction() as conn:
+                conn.executemany(
+                    """
+                    UPDATE teklifler
+                    SET firm = ?, subject = ?, amount = ?, currency = ?
+                    WHERE file_path = ?
+                    """,
+                    rows,
+                )
+            updated_count = len(rows)
         st.success(f"✅ {updated_count} kayıt güncellendi!")
         st.rerun()
 
@@ -1017,7 +1068,7 @@ def render_dashboard_page() -> None:
     """Dashboard sayfası: İstatistikler ve grafikler"""
     st.header("📊 Dashboard")
 
-    stats = get_dashboard_stats()
+    stats = cached_dashboard_stats(get_db_version())
 
     # Top metrics
     col1, col2 = st.columns(2)
@@ -1061,6 +1112,10 @@ def ensure_temp_dir() -> str:
 
 
 def pick_folder() -> str | None:
+    # Imported here: Tcl/Tk is only needed for this dialog, not in worker processes or scripts importing main
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
     root.attributes("-topmost", True)
@@ -1074,7 +1129,7 @@ def pick_folder() -> str | None:
 def main() -> None:
     st.set_page_config(page_title="Teklif Listeleme", page_icon="📄", layout="wide")
 
-    init_db()
+    ensure_db_initialized()
     if "temp_dir" not in st.session_state:
         st.session_state.temp_dir = ensure_temp_dir()
 
@@ -1093,7 +1148,7 @@ def main() -> None:
 
     # Display backend log in sidebar
     with st.sidebar.expander("📜 Backend Logu"):
-        st.code(read_log_tail(max_lines=100), language="text")
+        st.code(cached_log_tail(100, get_file_stamp(LOG_PATH)), language="text")
 
     # Route to appropriate page
     if page == "🏠 Ana Sayfa":
@@ -0,0 +1,578 @@
+"""PDF text extraction and offer parsing, shared by the app and its parser processes.
+
+Lives outside the Streamlit script: Streamlit swaps ``__main__`` on every rerun, so
+functions defined there cannot be pickled reliably for ProcessPoolExecutor.
+"""
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+from pypdf import PdfReader  # Updated from PyPDF2 to pypdf for better encoding support
+
+try:
+    # PDFium extracts text far faster than pypdf's pure-Python parser
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - pypdf is used when PDFium is not installed
+    pdfium = None
+
+# "pypdf" forces the pure-Python extractor even when pypdfium2 is installed
+PDF_BACKEND = os.environ.get("TEKLIF_PDF_BACKEND", "pdfium").strip().lower()
+# Extractor tried first for page texts; cached pages are only reused for the same one
+PAGE_TEXT_BACKEND = "pdfium" if pdfium is not None and PDF_BACKEND != "pypdf" else "pypdf"
+# PDFium is not thread-safe, even across documents. Files parsed in-process run on the
+# Streamlit script threads of several sessions at once, so every call into it takes this lock.
+_PDFIUM_LOCK = threading.Lock()
+
+# Firm and subject are searched on this many leading pages (first page may be a cover image)
+HEADER_PAGE_COUNT = 3
+# Header lines those searches can reach: subject labels in the first 25 lines plus the line after
+HEADER_LINE_COUNT = 26
+
+# Header fields start a line (header blocks are built from stripped lines), so the
+# patterns are anchored with ^ and the regex engine rejects other offsets immediately
+FIRM_PATTERNS = [
+    # Turkish patterns
+    re.compile(r"^(?:Firma\s*Adı|Firma|Şirket|Müşteri|Kurum|Kuruluş)\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    # English patterns
+    re.compile(r"^(?:Company\s*Name|Company|Client|Customer|Organization)\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    # Company type abbreviations (works for both Turkish and English)
+    re.compile(r"^(.+?(?:A\.Ş\.|A\.S\.|Ltd\.?\s*Şti\.?|San\.|Tic\.|Ltd\.|Inc\.|Corp\.|GmbH))", re.IGNORECASE | re.MULTILINE),
+]
+
+GREETINGS_PATTERN = re.compile(r"(?:Sayın|Dear)\s+(.+)", re.IGNORECASE)
+# Greetings addressed to a person ("Sayın Ayşe Hanım") do not name the firm
+HONORIFIC_PATTERN = re.compile(r"\b(hanım|bey)\b", re.IGNORECASE)
+
+# Explicit firm label on a single line ("Firma Adı: ...", "Company Name: ...")
+# Label plus whatever follows it on the same line (empty when the value is on the next line)
+FIRM_LABEL_PATTERN = re.compile(r"(?:Firma\s*Adı|Firma|Company\s*Name)\s*[:\-]\s*(.*)", re.IGNORECASE)
+
+# Trailing noise after a field value - both Turkish and English stopwords
+# Turkish: Referansınız, Teklif No, Tarih, Sayfa
+# English: Your Reference, Offer No, Page, History, Topic
+TRAILING_NOISE_PATTERN = re.compile(
+    r"\s+(?:Referans|Teklif\s*No|Tarih|Sayfa|Your|Offer|Page|History|Topic)", re.IGNORECASE
+)
+
+SUBJECT_PATTERNS = [
+    # Turkish patterns
+    re.compile(r"^Konu\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"^Teklif\s*Konusu\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"^İlgi\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    # English patterns
+    re.compile(r"^Subject\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"^Regarding\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"^Project\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+    # Both languages
+    re.compile(r"^(?:Re|RE|Ref)\s*[:\-]?\s*(.+)", re.IGNORECASE | re.MULTILINE),
+]
+
+# Explicit subject label on a single line ("Konu: ...", "Teklif Konusu - ...")
+SUBJECT_LABEL_PATTERN = re.compile(r"(?:Konu|Teklif\s*Konusu)\s*[:\-]\s*(.*)", re.IGNORECASE)
+
+AMOUNT_PATTERNS = [
+    # PRIORITY 1: Sum pattern (most specific - final total in proposals)
+    # Must come first to avoid matching subtotals like "Total Quote"
+    # Example: "Sum                    2.125.400€"
+    re.compile(
+        r"\bSum\s*[:\-]?\s+([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)",
+        re.IGNORECASE,
+    ),
+
+    # PRIORITY 2: Turkish patterns - Total amount with keywords
+    # Example: "Toplam Tutar: 1.677 289,00 Euro" or "Teklif Tutarı: 157.500 €"
+    re.compile(
+        r"(?:Toplam\s*(?:Tutar|Fiyat)?|Teklif\s*Tutarı|Genel\s*Toplam)\s*[:\-]?\s*(?:\([^\)]*\))?\s*([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro)",
+        re.IGNORECASE,
+    ),
+
+    # PRIORITY 3: English patterns - Grand Total (avoid "Total Quote" which is subtotal)
+    # Example: "Grand Total: 1,925.000€" or "Total Price: 1.925.000€"
+    re.compile(
+        r"(?:Grand\s*Total|Total\s*(?:Price|Amount|Cost))\s*[:\-]?\s*(?:\([^\)]*\))?\s+([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)",
+        re.IGNORECASE,
+    ),
+
+    # FALLBACK: Match large amounts with currency (minimum 4 characters)
+    # This catches amounts without keywords - use only as last resort
+    re.compile(r"([\d\.\,\s]{4,}?)\s*(€|TL|₺|USD|EUR|euro|\$)", re.IGNORECASE),
+]
+
+# AMOUNT_PATTERNS as they run on fold_case() text: same order, lowercase literals and no
+# re.IGNORECASE. Each is paired with the literal keyword(s) a page needs for it to match
+# (None means no fixed keyword); pages without them are skipped before the regex runs.
+# Keep in sync with AMOUNT_PATTERNS; test_amount_patterns.py checks both match alike.
+_FOLDED_AMOUNT_PATTERNS: list[tuple[re.Pattern[str], tuple[str, ...] | None]] = [
+    (
+        re.compile(r"\bsum\s*[:\-]?\s+([\d\.\,\s]{4,}?)\s*(€|tl|₺|usd|eur|euro|\$)"),
+        ("sum",),
+    ),
+    (
+        re.compile(
+            r"(?:toplam\s*(?:tutar|fiyat)?|teklif\s*tutari|genel\s*toplam)\s*[:\-]?\s*(?:\([^\)]*\))?\s*([\d\.\,\s]{4,}?)\s*(€|tl|₺|usd|eur|euro)"
+        ),
+        ("toplam", "teklif", "genel"),
+    ),
+    (
+        re.compile(
+            r"(?:grand\s*total|total\s*(?:price|amount|cost))\s*[:\-]?\s*(?:\([^\)]*\))?\s+([\d\.\,\s]{4,}?)\s*(€|tl|₺|usd|eur|euro|\$)"
+        ),
+        ("grand", "total"),
+    ),
+    (re.compile(r"([\d\.\,\s]{4,}?)\s*(€|tl|₺|usd|eur|euro|\$)"), None),
+]
+
+# Every AMOUNT_PATTERNS entry ends with one of these currencies (folded, "eur" also covers "euro").
+# Pages without any of them cannot match and skip all amount patterns, including the fallback.
+_CURRENCY_TOKENS = ("€", "₺", "$", "tl", "eur", "usd")
+
+# Firm name abbreviations for standardization
+_ABBREVIATIONS = {
+    "a.ş": "A.Ş",
+    "a.ş.": "A.Ş.",
+    "ltd": "Ltd.",
+    "ltd.": "Ltd.",
+    "şti": "Şti.",
+    "şti.": "Şti.",
+    "inc": "Inc.",
+    "inc.": "Inc.",
+    "gmbh": "GmbH",
+}
+# Pre-compile regex patterns for performance
+_COMPILED_ABBR_PATTERNS = [
+    (re.compile(re.escape(k), re.IGNORECASE), v) for k, v in _ABBREVIATIONS.items()
+]
+
+
+@dataclass(slots=True)
+class OfferRecord:
+    file_path: str
+    firm: str
+    subject: str
+    amount: float | None
+    currency: str | None
+
+
+@dataclass
+class HeaderPage:
+    """Stripped, non-empty lines of a leading page, shared by firm and subject extraction"""
+    lines: list[str]
+
+
+def extract_page_text(page, path: str, page_number: int) -> str:
+    try:
+        return sanitize_text(page.extract_text() or "")
+    except Exception as exc:  # noqa: BLE001
+        logging.warning(
+            "Sayfa metni okunamadı: %s (sayfa %s): %s",
+            path,
+            page_number,
+            sanitize_text(str(exc)),
+        )
+        return ""
+
+
+def load_pdf_reader(path: str, data: bytes | None = None) -> PdfReader | None:
+    try:
+        return PdfReader(path if data is None else BytesIO(data), strict=False)
+    except Exception as exc:  # noqa: BLE001
+        logging.warning("PDF okunamadı: %s (%s)", path, sanitize_text(str(exc)))
+        return None
+
+
+def read_pdfium_page_text(page) -> str:
+    with _PDFIUM_LOCK:
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+
+
+def iter_pdfium_pages(document, path: str) -> Iterator[str]:
+    # Every PDFium call holds _PDFIUM_LOCK; pages are closed before their text is yielded
+    try:
+        with _PDFIUM_LOCK:
+            page_count = len(document)
+        for index in range(page_count):
+            with _PDFIUM_LOCK:
+                page = document[index]
+            try:
+                text = sanitize_text(read_pdfium_page_text(page))
+            except Exception as exc:  # noqa: BLE001
+                logging.warning(
+                    "Sayfa metni okunamadı: %s (sayfa %s): %s",
+                    path,
+                    index + 1,
+                    sanitize_text(str(exc)),
+                )
+                text = ""
+            finally:
+                with _PDFIUM_LOCK:
+                    page.close()
+            yield text
+    finally:
+        with _PDFIUM_LOCK:
+            document.close()
+
+
+def iter_pages_from_pdf(path: str, data: bytes | None = None) -> Iterator[str]:
+    """Yield page texts one by one so callers can stop before decoding the whole PDF.
+
+    ``data`` holds the already read file content; ``path`` is then only used for logging.
+    """
+    if PAGE_TEXT_BACKEND == "pdfium":
+        try:
+            with _PDFIUM_LOCK:
+                document = pdfium.PdfDocument(path if data is None else data)
+        except Exception as exc:  # noqa: BLE001
+            logging.info("PDFium açamadı, pypdf deneniyor: %s (%s)", path, sanitize_text(str(exc)))
+        else:
+            yield from iter_pdfium_pages(document, path)
+            return
+
+    reader = load_pdf_reader(path, data)
+    if reader is None:
+        return
+    for index, page in enumerate(reader.pages, start=1):
+        yield extract_page_text(page, path, index)
+
+
+def sanitize_text(value: str) -> str:
+    # Remove surrogate characters and other problematic Unicode.
+    # Only lone surrogates fail strict encoding, so clean text is returned as is
+    # and the costly round-trip is reserved for the rare broken page.
+    if value.isascii():
+        return value
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        return value.encode("utf-8", errors="surrogatepass").decode("utf-8", errors="replace")
+    return value
+
+
+def normalize_currency(currency: str | None) -> str | None:
+    """Normalize currency code to uppercase standard format.
+
+    Args:
+        currency: Raw currency string (e.g., "Eur", "€", "TL")
+
+    Returns:
+        Standardized currency code (e.g., "EUR", "TL", "USD") or None
+    """
+    if not currency:
+        return None
+
+    currency_upper = currency.upper().strip()
+    if currency_upper in ("€", "EURO", "EUR"):
+        return "EUR"
+    if currency_upper in ("₺", "TL", "TRY"):
+        return "TL"
+    if currency_upper == "USD":
+        return "USD"
+    return currency_upper
+
+
+def normalize_firm_name(firm: str) -> str:
+    """Normalize firm name for consistency.
+
+    Applies title case but preserves common business abbreviations
+    like A.Ş, Ltd., Inc., etc. Uses pre-compiled regex patterns for performance.
+    """
+    if not firm or len(firm) <= 2:
+        return firm
+
+    # Apply title case
+    normalized = firm.title()
+
+    # Fix common abbreviations using pre-compiled patterns
+    for pattern, replacement in _COMPILED_ABBR_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+
+    return normalized.strip()
+
+
+def extract_field(patterns: list[re.Pattern], text: str) -> str:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            value = match.group(1).strip()
+            # Keep only the first line (splitlines handles \n, \r and \r\n)
+            value = value.splitlines()[0].strip() if value else value
+            # Remove trailing noise (only the part before the first stopword is kept)
+            value = TRAILING_NOISE_PATTERN.split(value, maxsplit=1)[0].strip()
+            return value
+    return ""
+
+
+def build_header_pages(pages_text: list[str]) -> list[HeaderPage]:
+    """Split the first HEADER_PAGE_COUNT pages into lines once per PDF.
+
+    Only the first HEADER_LINE_COUNT non-empty lines are stripped and kept; the
+    rest of a long page is never looked at by extract_firm/extract_subject.
+    """
+    return [
+        HeaderPage(
+            list(islice((stripped for line in page_text.splitlines() if (stripped := line.strip())), HEADER_LINE_COUNT))
+        )
+        for page_text in pages_text[:HEADER_PAGE_COUNT]
+    ]
+
+
+def extract_firm(header_pages: list[HeaderPage]) -> str:
+    if not header_pages:
+        return ""
+
+    # Try first 3 pages (in case first page is cover image)
+    for page_idx, header_page in enumerate(header_pages):
+        lines = header_page.lines
+        if not lines:
+            continue  # Skip empty pages
+
+        # Try to find "Firma Adı:" or "Company Name:" in first 20 lines
+        for i, line in enumerate(lines[:20]):
+            # Search for both Turkish and English firm labels
+            label_match = FIRM_LABEL_PATTERN.search(line)
+            if label_match:
+                logging.debug(f"Firma etiketi bulundu (sayfa {page_idx + 1}): {line}")
+                # Try to get firm name from same line after colon
+                firm = label_match.group(1).strip()
+                if firm:
+                    logging.debug(f"Aynı satırdan firma çıkartıldı (ham): {firm}")
+                    # Clean up trailing noise - both Turkish and English
+                    firm = TRAILING_NOISE_PATTERN.split(firm, maxsplit=1)[0].strip()
+                    logging.debug(f"Temizlenmiş firma: {firm}")
+                    if firm and len(firm) > 2:
+                        return normalize_firm_name(firm)
+                # If not found on same line, check next line
+                if i + 1 < len(lines):
+                    firm = lines[i + 1].strip()
+                    logging.debug(f"Sonraki satırdan firma çıkartıldı: {firm}")
+                    firm = TRAILING_NOISE_PATTERN.split(firm, maxsplit=1)[0].strip()
+                    if firm and len(firm) > 2:
+                        return normalize_firm_name(firm)
+
+        # Fallback to header block extraction for this page
+        header_block = "\n".join(lines[:12])
+        firm = extract_field(FIRM_PATTERNS, header_block)
+        if firm and len(firm) > 2:
+            logging.debug(f"Header block'tan firma (sayfa {page_idx + 1}): {firm}")
+            return normalize_firm_name(firm)
+
+        # Try greetings pattern
+        for line in lines[:15]:
+            match = GREETINGS_PATTERN.search(line)
+            if not match:
+                continue
+            candidate = match.group(1).strip()
+            if HONORIFIC_PATTERN.search(candidate):
+                continue
+            if len(candidate) > 2:
+                logging.debug(f"Greetings pattern'den firma (sayfa {page_idx + 1}): {candidate}")
+                return normalize_firm_name(candidate)
+
+    logging.warning("Firma adı bulunamadı. İlk %s sayfa kontrol edildi.", HEADER_PAGE_COUNT)
+    return ""
+
+
+def extract_subject(header_pages: list[HeaderPage]) -> str:
+    if not header_pages:
+        return ""
+
+    # Try first 3 pages (in case first page is cover image)
+    for header_page in header_pages:
+        lines = header_page.lines
+        if not lines:
+            continue  # Skip empty pages
+
+        # Try to find "Konu:" label in first 25 lines
+        for i, line in enumerate(lines[:25]):
+            label_match = SUBJECT_LABEL_PATTERN.search(line)
+            if label_match:
+                # Extract subject from same line or next line
+                subject = label_match.group(1).strip()
+                if subject:
+                    return subject[:200]  # Max 200 chars
+                # Check next line if not on same line
+                if i + 1 < len(lines):
+                    return lines[i + 1].strip()[:200]
+
+        # Fallback to header block
+        header_block = "\n".join(lines[:18])
+        subject = extract_field(SUBJECT_PATTERNS, header_block)
+        if subject:
+            return subject
+
+    return ""
+
+
+def parse_amount(raw_amount: str, currency: str | None) -> tuple[float | None, str | None]:
+    # Turkish format: 27.560,50 or 27.560 or "1.677 289,00" (dot/space=thousands, comma=decimal)
+    # English format: 27,560.50 or 27.560 (comma=thousands, dot=decimal)
+
+    # Remove all spaces first (support formats like "1.677 289,00")
+    raw_amount = raw_amount.replace(" ", "").strip()
+
+    # Reject amounts that are too small (likely noise like "1.00", "2.00")
+    if len(raw_amount.replace(".", "").replace(",", "")) < 3:
+        return None, None
+
+    # If both comma and dot exist, determine which is decimal separator
+    if "," in raw_amount and "." in raw_amount:
+        # Check which comes last (that's the decimal separator)
+        last_comma_pos = raw_amount.rfind(",")
+        last_dot_pos = raw_amount.rfind(".")
+        if last_comma_pos > last_dot_pos:
+            # Turkish: dot=thousands, comma=decimal (e.g., 1.234,56)
+            normalized = raw_amount.replace(".", "").replace(",", ".")
+        else:
+            # English: comma=thousands, dot=decimal (e.g., 1,234.56)
+            normalized = raw_amount.replace(",", "")
+    elif "," in raw_amount:
+        # Only comma - assume Turkish decimal separator (e.g., 1234,56)
+        normalized = raw_amount.replace(",", ".")
+    elif "." in raw_amount:
+        # Only dot - check if it's thousands or decimal separator
+        # If exactly 3 digits follow the last dot, it's likely thousands separator (e.g., 27.560)
+        if len(raw_amount) - raw_amount.rfind(".") == 4:
+            # Turkish thousands separator (e.g., 27.560 = 27560)
+            normalized = raw_amount.replace(".", "")
+        else:
+            # Decimal separator (e.g., 27.5 or 27.56)
+            normalized = raw_amount
+    else:
+        normalized = raw_amount
+
+    try:
+        amount = float(normalized)
+        # Normalize currency using helper function
+        normalized_currency = normalize_currency(currency)
+        return amount, normalized_currency
+    except ValueError:
+        return None, None
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text so plain substring checks agree with re.IGNORECASE matching.
+
+    str.lower() turns "İ" into "i" + combining dot and keeps "ı"/"ſ" as they are,
+    while the regex engine treats all of them as plain "i"/"s". Chained replace()
+    calls are much faster than str.translate with a dict table.
+    """
+    return text.lower().replace("\u0307", "").replace("ı", "i").replace("ſ", "s")
+
+
+def _match_amount(pattern: re.Pattern[str], page_text: str) -> tuple[float | None, str | None]:
+    match = pattern.search(page_text)
+    if not match:
+        return None, None
+    raw_amount = match.group(1).strip()
+    currency = match.group(2) if match.lastindex and match.lastindex >= 2 else None
+    return parse_amount(raw_amount, currency)
+
+
+def extract_amount_from_pages(pages_text: Iterable[str]) -> tuple[float | None, str | None]:
+    """Find the amount, trying AMOUNT_PATTERNS in priority order across all pages.
+
+    Pages may be a lazy iterator: a hit of the first (highest priority) pattern
+    wins outright, so pages after it are never pulled. The remaining patterns
+    need every page, because a better pattern may still match further on.
+    """
+    (first_pattern, first_keywords), *other_patterns = _FOLDED_AMOUNT_PATTERNS
+    # Fold every page once; patterns search the folded text, and only on pages containing their keyword
+    seen_pages: list[str] = []
+    for page_text in pages_text:
+        folded = fold_case(page_text)
+        if not any(token in folded for token in _CURRENCY_TOKENS):
+            continue  # No currency on this page, so no pattern can match it
+        if not first_keywords or any(keyword in folded for keyword in first_keywords):
+            amount, currency = _match_amount(first_pattern, folded)
+            if amount is not None:
+                return amount, currency
+        seen_pages.append(folded)
+
+    for pattern, keywords in other_patterns:
+        for folded in seen_pages:
+            if keywords and not any(keyword in folded for keyword in keywords):
+                continue
+            amount, currency = _match_amount(pattern, folded)
+            if amount is not None:
+                return amount, currency
+    return None, None
+
+
+def looks_like_offer(firm: str, subject: str, amount: float | None) -> bool:
+    """Check if extracted data looks like a valid offer.
+
+    Requires at least 2 out of 3 fields (firm, subject, amount) to be found.
+    This prevents random PDFs from being classified as offers.
+    """
+    found_fields = 0
+
+    if firm and len(firm) > 2:
+        found_fields += 1
+    if subject and len(subject) > 2:
+        found_fields += 1
+    if amount is not None:
+        found_fields += 1
+
+    # Accept if we found at least 2 out of 3 key fields
+    return found_fields >= 2
+
+
+def parse_offer(path: str, pages: Iterable[str] | None = None) -> OfferRecord | None:
+    """Parse an offer PDF; pass ``pages`` to reuse already extracted page texts"""
+    pages = iter(iter_pages_from_pdf(path) if pages is None else pages)
+    # Firm and subject only look at the first pages; the amount search pulls the rest lazily
+    first_pages = list(islice(pages, HEADER_PAGE_COUNT))
+    header_pages = build_header_pages(first_pages)
+    firm = extract_firm(header_pages)
+    subject = extract_subject(header_pages)
+    # Two of the three fields are required; with neither firm nor subject found an
+    # amount cannot make this an offer, so the remaining pages are never decoded
+    if not looks_like_offer(firm, subject, 0.0):
+        return None
+    amount, currency = extract_amount_from_pages(chain(first_pages, pages))
+    if not looks_like_offer(firm, subject, amount):
+        return None
+    return OfferRecord(
+        file_path=path,
+        firm=firm,
+        subject=subject,
+        amount=amount,
+        currency=currency,
+    )
+
+
+def record_pages(pages: Iterable[str], sink: list[str]) -> Iterator[str]:
+    """Pass pages through while keeping a copy of every page actually decoded"""
+    for page_text in pages:
+        sink.append(page_text)
+        yield page_text
+
+
+def parse_offer_safe(
+    path: str, cached_pages: list[str] | None = None, data: bytes | None = None
+) -> tuple[OfferRecord | None, str | None, list[str]]:
+    """Parse a single PDF in a worker process.
+
+    ``data`` is the prefetched file content, if any. Returns the parsed record
+    (or None), an error message if parsing failed and the page texts that were
+    decoded (for the text cache).
+    Workers import it from this module, so it pickles by reference.
+    """
+    decoded: list[str] = [] if cached_pages is None else cached_pages
+    try:
+        if cached_pages is None:
+            record = parse_offer(path, record_pages(iter_pages_from_pdf(path, data), decoded))
+        else:
+            record = parse_offer(path, cached_pages)
+        return record, None, decoded
+    except Exception as exc:  # noqa: BLE001
+        logging.exception("Dosya işlenemedi: %s", path)
+        return None, f"{os.path.basename(path)}: {sanitize_text(str(exc))}", []
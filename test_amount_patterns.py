@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Check that the folded amount patterns match exactly like AMOUNT_PATTERNS with IGNORECASE"""
+import os
+import random
+import re
+import sys
+
+# Add parent directory to path to import teklif_parser
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from teklif_parser import AMOUNT_PATTERNS, _FOLDED_AMOUNT_PATTERNS, fold_case
+
+SAMPLE_TEXTS = [
+    "Sum                    2.125.400€",
+    "SUM: 1.500,00 EUR",
+    "Toplam Tutar: 1.677 289,00 Euro",
+    "TEKLİF TUTARI: 157.500 €",
+    "Teklif Tutarı (KDV Hariç) 98.000,00 TL",
+    "Genel Toplam 45.000 USD",
+    "Grand Total: 1,925.000€",
+    "TOTAL PRICE   1.925.000 $",
+    "Total Quote 10.000 €\nSum 12.500 €",
+    "Fiyat 12.000 tl",
+    "Toplam: 12 €",
+]
+
+
+def _letters_in(pattern: re.Pattern[str]) -> set[str]:
+    # Escapes like \d or \s are classes, not literal letters
+    return {c for c in re.sub(r"\\.", "", pattern.pattern) if c.isalpha()}
+
+
+def test_pattern_lists_in_sync():
+    print("Desen listeleri:")
+    print("=" * 70)
+    assert len(_FOLDED_AMOUNT_PATTERNS) == len(AMOUNT_PATTERNS)
+    for pattern, (folded, keywords) in zip(AMOUNT_PATTERNS, _FOLDED_AMOUNT_PATTERNS):
+        assert pattern.flags & re.IGNORECASE
+        assert not folded.flags & re.IGNORECASE
+        assert folded.pattern == fold_case(pattern.pattern), folded.pattern
+        # Uppercase escapes (\D, \S, \W, \B, \A, \Z) would change meaning when folded
+        assert not re.search(r"\\[A-Z]", pattern.pattern), pattern.pattern
+        print(f"✓ {folded.pattern[:60]}  anahtar: {keywords}")
+    print()
+
+
+def test_letters_fold_like_ignorecase():
+    # For every letter the patterns use, the code points IGNORECASE matches must be
+    # exactly the ones fold_case turns into that letter
+    print("Harf eşlemeleri:")
+    print("=" * 70)
+    all_chars = "".join(chr(c) for c in range(0x110000) if not 0xD800 <= c <= 0xDFFF)
+    folded_by_char = {c: fold_case(c) for c in all_chars}
+    letters = set().union(*(_letters_in(pattern) for pattern in AMOUNT_PATTERNS))
+    for letter in sorted(letters, key=str.lower):
+        matched = set(re.findall(re.escape(letter), all_chars, re.IGNORECASE))
+        folded = {c for c, f in folded_by_char.items() if f == fold_case(letter)}
+        assert matched == folded, (letter, matched ^ folded)
+        print(f"✓ {letter}: {''.join(sorted(matched))}")
+    print()
+
+
+def _random_text(rng: random.Random) -> str:
+    words = [
+        "Sum", "SUM", "Toplam", "TOPLAM", "Tutar", "Tutarı", "TUTARI", "Fiyat", "Teklif", "TEKLİF",
+        "Genel", "Grand", "Total", "Price", "Amount", "Cost", "Quote", "(KDV Hariç)", ":", "-",
+        "€", "TL", "tl", "₺", "USD", "EUR", "Euro", "$", "İ", "ı", "ſ",
+    ]
+    parts = []
+    for _ in range(rng.randint(1, 12)):
+        if rng.random() < 0.4:
+            parts.append("".join(rng.choice("0123456789., ") for _ in range(rng.randint(1, 12))))
+        else:
+            parts.append(rng.choice(words))
+    return rng.choice([" ", "  ", "\n", ""]).join(parts)
+
+
+def test_folded_patterns_match_alike():
+    print("Örnek metinler:")
+    print("=" * 70)
+    rng = random.Random(0)
+    texts = SAMPLE_TEXTS + [_random_text(rng) for _ in range(20000)]
+    hits = 0
+    for text in texts:
+        folded_text = fold_case(text)
+        for pattern, (folded, keywords) in zip(AMOUNT_PATTERNS, _FOLDED_AMOUNT_PATTERNS):
+            expected = pattern.search(text)
+            result = folded.search(folded_text)
+            assert (expected is None) == (result is None), (pattern.pattern, text)
+            if expected is None:
+                continue
+            hits += 1
+            assert expected.group(1) == result.group(1), text
+            assert fold_case(expected.group(2)) == result.group(2), text
+            # The keyword gate in extract_amount_from_pages must never skip a matching page
+            assert not keywords or any(keyword in folded_text for keyword in keywords), text
+    print(f"✓ {len(texts)} metin, {hits} eşleşme aynı")
+    print()
+
+
+if __name__ == "__main__":
+    test_pattern_lists_in_sync()
+    test_letters_fold_like_ignorecase()
+    test_folded_patterns_match_alike()